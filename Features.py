@@ -1,82 +1,106 @@
 import py_stringmatching as ps
-import csv
-from datetime import datetime, date
+import numpy as np
+import pandas as pd
+from datetime import date
 from sklearn import tree, ensemble, svm, naive_bayes, linear_model
 from sklearn.metrics import precision_recall_fscore_support
-
-# Reading every row of csv into a list
-f = open('SampledData.csv', 'rb')
-csvRead = csv.reader(f, delimiter=',')
-sampledList = []
-for row in csvRead:
-    row[0] = int(row[0])
-    row[-1] = int(row[-1])
-    timeObj1=datetime.strptime(row[6].strip(), '%M:%S').time()
-    row[6] = timeObj1
-    timeObj1=datetime.strptime(row[10].strip(), '%M:%S').time()
-    row[10] = timeObj1
-    # iteration #2: trim whitespaces from artist and track labels
-    row[3] = row[3].strip()
-    row[4] = row[4].strip()
-    row[7] = row[7].strip()
-    row[8] = row[8].strip()
-    sampledList.append(row)
-f.close()
+from sklearn.model_selection import cross_val_predict, LeaveOneOut
+try:
+    from jellyfish import jaro_similarity
+except ImportError:
+    # jellyfish releases that still support python 2 call it jaro_distance
+    from jellyfish import jaro_distance as jaro_similarity
+
+# Reading every row of csv into a data frame
+# (decoded as unicode, which jellyfish requires on python 2, and with no NA parsing so that
+# artists or tracks named e.g. "NA" or "Null" stay strings)
+sampled = pd.read_csv('SampledData.csv', header=None, skipinitialspace=True, encoding='utf-8',
+                      keep_default_na=False, dtype={3: object, 4: object, 7: object, 8: object})
+# iteration #2: trim whitespaces from artist and track labels
+for col in [3, 4, 7, 8]:
+    sampled[col] = sampled[col].str.strip()
 
 # Converting every row in to a feature vector
-featList = []
-label = []
 ws = ps.WhitespaceTokenizer()
-for item in sampledList:
-    fi = []
 
-    jaro1 = ps.Jaro()
+# the same artists and tracks show up in many candidate pairs, so remember scores and tokens
+jaroCache = {}
+tokenCache = {}
+
+
+def jaro_score(s1, s2):
+    key = (s1, s2)
+    if key not in jaroCache:
+        jaroCache[key] = jaro_similarity(s1, s2)
+    return jaroCache[key]
+
+
+def tokenize(string):
+    if string not in tokenCache:
+        tokenCache[string] = ws.tokenize(string)
+    return tokenCache[string]
+
+
+def string_features(pair):
+    artist1, track1, artist2, track2 = pair
 
     # iteration #3:
     # pull the feature value to zero if none of the token pairs from either artist strings have a high
     # enough similarity score
     f1 = 0
-    for t1 in ws.tokenize(item[3]):
-        if max([jaro1.get_raw_score(t1, t2) for t2 in ws.tokenize(item[7])]) > .75:
-            f1 = jaro1.get_raw_score(item[3], item[7])
+    tokens2 = tokenize(artist2)
+    for t1 in tokenize(artist1):
+        # jaro is at most (2 + shorter/longer) / 3, so it can only pass .75 when the shorter
+        # token is more than a quarter of the longer one
+        if any(jaro_score(t1, t2) > .75 for t2 in tokens2 if 4 * min(len(t1), len(t2)) > max(len(t1), len(t2))):
+            f1 = jaro_score(artist1, artist2)
             break
 
-    # iteration #3:
-    # if the artist doesn't match scale down the track similarity by a factor of 3
-    # and if the track score isn't high enough pull it down to 0
-    jaro2 = ps.Jaro()
-    f2 = jaro1.get_raw_score(item[4], item[8])
-    if f1 == 0:
-        f2 /= 3
-    elif f2 < 0.6:
-        f2 = 0
-
-    # convert to datetime object
-    date1 = datetime.strptime(item[5],'%d-%b-%y')
-    date2 = datetime.strptime(item[9],'%d-%b-%y')
-    timeObj4 = datetime.strptime('00:00:00', '%H:%M:%S').time()
-    # take the difference of the weights
-    dif = datetime.combine(max(date1, date2), timeObj4) - datetime.combine( min(date1, date2), timeObj4)
-    norm = datetime.combine(date.today(), timeObj4)- datetime.combine( min(date1, date2), timeObj4)
-    # normalize the feature value
-    f3 = 1.0*(norm.days-dif.days)/norm.days
-
-    # convert to datetime object
-    timeObj3 = datetime.strptime('00:00', '%M:%S').time()
-    # take the difference of the track time lengths
-    f4 = (datetime.combine(date.today(), max(item[6],item[10])) - datetime.combine(date.today(), min(item[6],item[10]))).total_seconds()#Time -6,10 - diff/max
-    f4de =(datetime.combine(date.today(), max(item[6],item[10])) - datetime.combine(date.today(), timeObj3)).total_seconds()
-    # normalize the feature value
-    f4 /= f4de
-    f4 = 1.0 - f4
-
-    # add the feature values to the feature vector
-    fi.append(f1)
-    fi.append(f2)
-    fi.append(f3)
-    fi.append(f4)
-    label.append(item[-1])
-    featList.append(fi)
+    return f1, jaro_score(track1, track2)
+
+
+# candidate sets repeat whole artist/track pairs too, so score each distinct pair once
+pairs = list(zip(sampled[3], sampled[4], sampled[7], sampled[8]))
+pairScores = dict((pair, string_features(pair)) for pair in set(pairs))
+stringFeat = np.array([pairScores[pair] for pair in pairs])
+f1 = stringFeat[:, 0]
+trackScore = stringFeat[:, 1]
+
+# iteration #3:
+# if the artist doesn't match scale down the track similarity by a factor of 3
+# and if the track score isn't high enough pull it down to 0
+f2 = np.select([f1 == 0, trackScore < 0.6], [trackScore / 3, 0.0], default=trackScore)
+
+
+def days(column):
+    # release dates as whole days since the epoch
+    return pd.to_datetime(column, format='%d-%b-%y').values.astype('datetime64[D]').astype(np.int64)
+
+
+def seconds(column):
+    # mm:ss track lengths as whole seconds
+    mmss = column.str.split(':', expand=True).astype(np.int64)
+    return mmss[0].values * 60 + mmss[1].values
+
+
+# take the difference of the release dates
+date1 = days(sampled[5])
+date2 = days(sampled[9])
+today = np.datetime64(date.today(), 'D').astype(np.int64)
+dif = np.abs(date1 - date2)
+norm = today - np.minimum(date1, date2)
+# normalize the feature value
+f3 = 1.0 * (norm - dif) / norm
+
+# take the difference of the track time lengths normalized by the longer one
+time1 = seconds(sampled[6])
+time2 = seconds(sampled[10])
+longer = np.maximum(time1, time2)
+f4 = 1.0 - np.true_divide(np.abs(time1 - time2), longer, out=np.ones(len(longer)), where=longer > 0)
+
+# the tree learners work in float32 internally, so store the features that way up front
+featList = np.column_stack([f1, f2, f3, f4]).astype(np.float32)
+label = sampled[11].values
 
 
 # split the data-set in to development set (I) and evaluation sets (J)
@@ -85,47 +109,23 @@ Jfeat = featList[300:-1]
 Ilabel = label[0:300]
 Jlabel = label[300:-1]
 
-# initialize data structures for cross validation
-dtTrue = []
-rfTrue = []
-svmTrue = []
-gnbTrue = []
-lrTrue = []
-
 # STEP 2: perform leave-one-out-cross-validation
-for i in range(len(Ifeat)):
-    X = Ifeat[0:i] + Ifeat[i+1:]
-    Y = Ilabel[0:i] + Ilabel[i+1:]
-
-    # decision trees
-    dt = tree.DecisionTreeClassifier()
-    dt = dt.fit(X, Y)
-    dtPred = dt.predict([Ifeat[i]])
-    dtTrue.append(dtPred)
-
-    # random forest
-    rf = ensemble.RandomForestClassifier()
-    rf = rf.fit(X, Y)
-    rfPred = rf.predict([Ifeat[i]])
-    rfTrue.append(rfPred)
-
-    # support vector machine
-    s1 = svm.SVC()
-    svmFit = s1.fit(X,Y)
-    svmPred = s1.predict([Ifeat[i]])
-    svmTrue.append(svmPred)
-
-    # gaussian naive bayes
-    gnb = naive_bayes.GaussianNB()
-    gnb = gnb.fit(X,Y)
-    gnbPred = gnb.predict([Ifeat[i]])
-    gnbTrue.append(gnbPred)
-
-    # logistic regression
-    lr = linear_model.LogisticRegression()
-    lr = lr.fit(X,Y)
-    lrPred = gnb.predict([Ifeat[i]])
-    lrTrue.append(lrPred)
+loo = LeaveOneOut()
+
+# decision trees
+dtTrue = cross_val_predict(tree.DecisionTreeClassifier(), Ifeat, Ilabel, cv=loo, n_jobs=-1)
+
+# random forest
+rfTrue = cross_val_predict(ensemble.RandomForestClassifier(), Ifeat, Ilabel, cv=loo, n_jobs=-1)
+
+# support vector machine
+svmTrue = cross_val_predict(svm.SVC(), Ifeat, Ilabel, cv=loo, n_jobs=-1)
+
+# gaussian naive bayes
+gnbTrue = cross_val_predict(naive_bayes.GaussianNB(), Ifeat, Ilabel, cv=loo, n_jobs=-1)
+
+# logistic regression
+lrTrue = cross_val_predict(linear_model.LogisticRegression(), Ifeat, Ilabel, cv=loo, n_jobs=-1)
 
 # report the scores for all the classifiers
 print "decision tree"
@@ -160,12 +160,12 @@ for i in range(len(Vlabel)):
     vFeatTrue.append(rfPredDebug[i])
 
     if Vlabel[i] == 0 and rfPredDebug[i] == 1:
-        print 'Debugging RF -> False Positive: ', sampledList[len(Ufeat) + i],  rfPredDebug[i]
+        print 'Debugging RF -> False Positive: ', sampled.iloc[len(Ufeat) + i].tolist(),  rfPredDebug[i]
         print Vfeat[i]
         print rfDebug.decision_path([Vfeat[i]])
 
     if Vlabel[i] == 1 and rfPredDebug[i] == 0:
-        print 'Debugging RF -> False Negative: ', sampledList[len(Ufeat) + i], rfPredDebug[i]
+        print 'Debugging RF -> False Negative: ', sampled.iloc[len(Ufeat) + i].tolist(), rfPredDebug[i]
         print Vfeat[i]
         print rfDebug.decision_path([Vfeat[i]])
 
@@ -180,49 +180,34 @@ print precision_recall_fscore_support(Vlabel, vFeatTrue)
 # decision tree trained on I and evaluated on J
 dtFinal = tree.DecisionTreeClassifier()
 dtFinal = dtFinal.fit(Ifeat, Ilabel)
-dtFinalTrue = []
-for i in range(len(Jfeat)):
-    dtPredFinal = dtFinal.predict([Jfeat[i]])
-    dtFinalTrue.append(dtPredFinal)
+dtFinalTrue = dtFinal.predict(Jfeat)
 print "Decision Tree evaluated on J:"
 print precision_recall_fscore_support(Jlabel, dtFinalTrue)
 
 # random forest (best classifier) trained on I and evaluated on J
 rfFinal = ensemble.RandomForestClassifier()
 rfFinal = rfFinal.fit(Ifeat, Ilabel)
-rfFinalTrue = []
-for i in range(len(Jfeat)):
-    rfPredFinal = rf.predict([Jfeat[i]])
-    rfFinalTrue.append(rfPredFinal)
+rfFinalTrue = rfFinal.predict(Jfeat)
 print "Random Forest evaluated on J:"
 print precision_recall_fscore_support(Jlabel, rfFinalTrue)
 
 # support vector machine trained on I and evaluated on J
 svmFinal = svm.SVC()
 svmFinal = svmFinal.fit(Ifeat, Ilabel)
-svmFinalTrue = []
-for i in range(len(Jfeat)):
-    svmPredFinal = svmFinal.predict([Jfeat[i]])
-    svmFinalTrue.append(svmPredFinal)
+svmFinalTrue = svmFinal.predict(Jfeat)
 print "Support Vector Machine evaluated on J:"
 print precision_recall_fscore_support(Jlabel, svmFinalTrue)
 
 # gaussian naive bayes trained on I and evaluated on J
 gnbFinal = naive_bayes.GaussianNB()
 gnbFinal = gnbFinal.fit(Ifeat, Ilabel)
-gnbFinalTrue = []
-for i in range(len(Jfeat)):
-    gnbPredFinal = gnbFinal.predict([Jfeat[i]])
-    gnbFinalTrue.append(gnbPredFinal)
+gnbFinalTrue = gnbFinal.predict(Jfeat)
 print "Gaussian Naive Bayes evaluated on J:"
 print precision_recall_fscore_support(Jlabel, gnbFinalTrue)
 
 # logistic regression trained on I and evaluated on J
 lrFinal = linear_model.LogisticRegression()
 lrFinal = lrFinal.fit(Ifeat, Ilabel)
-lrFinalTrue = []
-for i in range(len(Jfeat)):
-    lrPredFinal = lrFinal.predict([Jfeat[i]])
-    lrFinalTrue.append(lrPredFinal)
+lrFinalTrue = lrFinal.predict(Jfeat)
 print "Logistic Regression evaluated on J:"
 print precision_recall_fscore_support(Jlabel, lrFinalTrue)
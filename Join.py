@@ -165,50 +165,51 @@ for ind in range(len(MatchingData)):
     IdA = MatchingData[ind][1]
     IdB = MatchingData[ind][2]
 
+    # look up the source rows once instead of re-indexing both tables for every attribute
+    rowA = TableA[TableAMap[IdA]]
+    rowB = TableB[TableBMap[IdB]]
+
     # Compare album from 2 orginal tables
-    if TableA[TableAMap[IdA]][1] == TableB[TableBMap[IdB]][1]:
-        Erow[3] = TableA[TableAMap[IdA]][1]
+    if rowA[1] == rowB[1]:
+        Erow[3] = rowA[1]
     else:
-        print str(ind + 1) + ' Conflict in attribute "Album"=> || Value in A: ' + TableA[TableAMap[IdA]][
-            1] + '||  Value in B:' + TableB[TableBMap[IdB]][
-                  1] + ' || Picking longer name into E and ValA if length is same.'
+        print str(ind + 1) + ' Conflict in attribute "Album"=> || Value in A: ' + rowA[1] + '||  Value in B:' + rowB[
+            1] + ' || Picking longer name into E and ValA if length is same.'
         print ''
-        if len(TableA[TableAMap[IdA]][1]) > len(TableB[TableBMap[IdB]][1]):
-            Erow[3] = TableA[TableAMap[IdA]][1]
-        elif len(TableA[TableAMap[IdA]][1]) < len(TableB[TableBMap[IdB]][1]):
-            Erow[3] = TableB[TableBMap[IdB]][1]
+        if len(rowA[1]) > len(rowB[1]):
+            Erow[3] = rowA[1]
+        elif len(rowA[1]) < len(rowB[1]):
+            Erow[3] = rowB[1]
         else:
-            Erow[3] = TableA[TableAMap[IdA]][1]
+            Erow[3] = rowA[1]
 
     # Compare genres from 2 original tables
-    if TableA[TableAMap[IdA]][2] == TableB[TableBMap[IdB]][2]:
-        Erow[4] = TableA[TableAMap[IdA]][2]
+    if rowA[2] == rowB[2]:
+        Erow[4] = rowA[2]
     else:
-        print str(ind + 1) + ' Conflict in attribute "Genres"=>|| Value in A: ' + TableA[TableAMap[IdA]][
-            2] + ' || Value in B:' + TableB[TableBMap[IdB]][
-                  2] + ' || Picking longer name into E and ValA if length is same.'
+        print str(ind + 1) + ' Conflict in attribute "Genres"=>|| Value in A: ' + rowA[2] + ' || Value in B:' + rowB[
+            2] + ' || Picking longer name into E and ValA if length is same.'
         print ''
-        if len(TableA[TableAMap[IdA]][2]) > len(TableB[TableBMap[IdB]][2]):
-            Erow[4] = TableA[TableAMap[IdA]][2]
-        elif len(TableA[TableAMap[IdA]][2]) < len(TableB[TableBMap[IdB]][2]):
-            Erow[4] = TableB[TableBMap[IdB]][2]
+        if len(rowA[2]) > len(rowB[2]):
+            Erow[4] = rowA[2]
+        elif len(rowA[2]) < len(rowB[2]):
+            Erow[4] = rowB[2]
         else:
-            Erow[4] = TableA[TableAMap[IdA]][2]
+            Erow[4] = rowA[2]
 
     # Compare labels from the two original tables
-    if TableA[TableAMap[IdA]][3] == TableB[TableBMap[IdB]][3]:
-        Erow[5] = TableA[TableAMap[IdA]][3]
+    if rowA[3] == rowB[3]:
+        Erow[5] = rowA[3]
     else:
-        print str(ind + 1) + ' Conflict in attribute "Label"=>|| Value in A: ' + TableA[TableAMap[IdA]][
-            3] + ' || Value in B:' + TableB[TableBMap[IdB]][
-                  3] + ' || Picking longer name into E and ValA if length is same.'
+        print str(ind + 1) + ' Conflict in attribute "Label"=>|| Value in A: ' + rowA[3] + ' || Value in B:' + rowB[
+            3] + ' || Picking longer name into E and ValA if length is same.'
         print ''
-        if len(TableA[TableAMap[IdA]][3]) > len(TableB[TableBMap[IdB]][3]):
-            Erow[5] = TableA[TableAMap[IdA]][3]
-        elif len(TableA[TableAMap[IdA]][3]) < len(TableB[TableBMap[IdB]][3]):
-            Erow[5] = TableB[TableBMap[IdB]][3]
+        if len(rowA[3]) > len(rowB[3]):
+            Erow[5] = rowA[3]
+        elif len(rowA[3]) < len(rowB[3]):
+            Erow[5] = rowB[3]
         else:
-            Erow[5] = TableA[TableAMap[IdA]][3]
+            Erow[5] = rowA[3]
 
     # Time can be compared from MatchingData
     if MatchingData[ind][6] == MatchingData[ind][10]:
@@ -235,13 +236,13 @@ for ind in range(len(MatchingData)):
             Erow[7] = MatchingData[ind][4]
 
     # Compare Price from the two original tables
-    if TableA[TableAMap[IdA]][-3] == TableB[TableBMap[IdB]][-3]:
-        Erow[8] = TableA[TableAMap[IdA]][-3]
+    if rowA[-3] == rowB[-3]:
+        Erow[8] = rowA[-3]
     else:
-        print str(ind + 1) + ' Conflict in attribute "Price"=> || Value in A: ' + TableA[TableAMap[IdA]][
-            -3] + '  || Value in B:' + TableB[TableBMap[IdB]][-3] + ' || Picking ValA into TableE.'
+        print str(ind + 1) + ' Conflict in attribute "Price"=> || Value in A: ' + rowA[-3] + '  || Value in B:' + rowB[
+            -3] + ' || Picking ValA into TableE.'
         print ''
-        Erow[8] = TableA[TableAMap[IdA]][-3]
+        Erow[8] = rowA[-3]
 
     # Compare Artist from MatchingData
     if MatchingData[ind][3] == MatchingData[ind][7]:
@@ -269,7 +270,7 @@ for ind in range(len(MatchingData)):
         Erow[10] = min(MatchingData[ind][5], MatchingData[ind][9])
 
     # Add rating from Table B
-    Erow[11] = TableB[TableBMap[IdB]][5]
+    Erow[11] = rowB[5]
 
     Erow[12] = ''
 
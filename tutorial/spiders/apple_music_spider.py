@@ -1,12 +1,21 @@
 import re
 import scrapy
 from scrapy.exceptions import CloseSpider
+from twisted.internet import threads
 
 
 class AppleMusicSpider(scrapy.Spider):
     name = "appleMusic"
     pagesScraped = 0
     maxPages = 5000
+    custom_settings = {
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 1.0,
+        'AUTOTHROTTLE_MAX_DELAY': 30.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 8.0,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'HTTPCACHE_ENABLED': True
+    }
     start_urls = [
         'https://itunes.apple.com/us/genre/music-pop/id14'
     ]
@@ -31,24 +40,36 @@ class AppleMusicSpider(scrapy.Spider):
         if self.pagesScraped > self.maxPages:
             raise CloseSpider('Finished scraping %s pages' % self.maxPages)
         adam_id = response.url.split('?i=')[1]
-        artist = response.css("tr[adam-id='" + adam_id + "'] td:nth-of-type(3) a span ::text").extract_first()
-        track_name = response.css("tr[adam-id='" + adam_id + "'] td:nth-of-type(2) span span[class='text'] ::text").extract_first()
-        with open('apple/' + self.simplify(artist) + '_' + self.simplify(track_name) + '.html', 'wb') as f:
-            f.write(response.body)
+        track_row = response.css("tr[adam-id='" + adam_id + "']")
+        # css() on a sub-selection also matches the container itself, so query below it with xpath
+        left_stack = response.css("div[id='left-stack']")
+        artist = track_row.css("td:nth-of-type(3) a span ::text").extract_first()
+        track_name = track_row.css("td:nth-of-type(2) span span[class='text'] ::text").extract_first()
+        # the same artist and track show up on singles, albums and deluxe editions, so key the file on the
+        # track id as well; otherwise concurrent writes to one path interleave and corrupt the page
+        file_name = 'apple/' + self.simplify(artist) + '_' + self.simplify(track_name) + '_' + adam_id + '.html'
+        # write the page from the reactor thread pool so the crawl isn't blocked on disk
+        write = threads.deferToThread(self.write_body, file_name, response.body)
+        write.addErrback(lambda failure: self.logger.error('Could not write %s: %s', file_name, failure.getErrorMessage()))
         self.pagesScraped += 1
         yield {
             'Id': 's_%s' % self.pagesScraped,
             'Artist': artist,
             'TrackName': track_name,
             'Album': response.css("h1[itemprop='name'] ::text").extract_first(),
-            'Time': response.css("tr[adam-id='" + adam_id + "'] td:nth-of-type(4) span span ::text").extract_first(),
-            'Price': response.css("tr[adam-id='" + adam_id + "'] td:nth-of-type(5) span span ::text").extract_first(),
-            'Rating': response.css("div[id='left-stack'] div div span[itemprop='ratingValue'] ::text").extract_first(),
-            'Genres': response.css("div[id='left-stack'] div ul li span[itemprop='genre'] ::text").extract(),
-            'Released': response.css("div[id='left-stack'] div ul li span[itemprop='dateCreated'] ::text").extract_first(),
-            'Label': response.css("div[id='left-stack'] div ul li.copyright ::text").extract_first()
+            'Time': track_row.css("td:nth-of-type(4) span span ::text").extract_first(),
+            'Price': track_row.css("td:nth-of-type(5) span span ::text").extract_first(),
+            'Rating': left_stack.xpath(".//div//div//span[@itemprop='ratingValue']//text()").extract_first(),
+            'Genres': left_stack.xpath(".//div//ul//li//span[@itemprop='genre']//text()").extract(),
+            'Released': left_stack.xpath(".//div//ul//li//span[@itemprop='dateCreated']//text()").extract_first(),
+            'Label': left_stack.xpath(".//div//ul//li[contains(concat(' ', normalize-space(@class), ' '), ' copyright ')]//text()").extract_first()
         }
 
     @staticmethod
     def simplify(string):
         return re.sub('[^A-Za-z0-9 ]+', '', string)
+
+    @staticmethod
+    def write_body(path, body):
+        with open(path, 'wb') as f:
+            f.write(body)